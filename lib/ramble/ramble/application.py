@@ -65,6 +65,8 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
     _builtin_required_key = 'required'
     _inventory_file_name = 'ramble_inventory.json'
     _status_file_name = 'ramble_status.json'
+    # FOM attributes holding strings used to filter candidate log lines
+    _fom_line_filter_attrs = ('contains', 'leading_token')
     _pipelines = ['analyze', 'archive', 'mirror', 'setup', 'pushtocache', 'execute']
     _language_classes = [ApplicationMeta, SharedMeta]
 
@@ -234,10 +236,10 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
                 out_str.append('\t' + rucolor.nested_1('Executables: ') +
                                f'{self._get_exec_order(wl_name)}\n')
                 out_str.append('\t' + rucolor.nested_1('Inputs: ') +
-                               f'{wl_conf["inputs"]}\n')
+                               f'{list(wl_conf.inputs)}\n')
                 out_str.append('\t' + rucolor.nested_1('Workload Tags: \n'))
-                if 'tags' in wl_conf and wl_conf['tags']:
-                    out_str.append(colified(wl_conf['tags'], indent=8) + '\n')
+                if wl_conf.tags:
+                    out_str.append(colified(wl_conf.tags, indent=8) + '\n')
 
                 if wl_name in self.environment_variables:
                     out_str.append(rucolor.nested_1('\tEnvironment Variables:\n'))
@@ -254,10 +256,10 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
                         indent = '\t\t'
 
                         out_str.append(rucolor.nested_2(f'{indent}{var}:\n'))
-                        out_str.append(f'{indent}\tDescription: {conf["description"]}\n')
-                        out_str.append(f'{indent}\tDefault: {conf["default"]}\n')
-                        if 'values' in conf:
-                            out_str.append(f'{indent}\tSuggested Values: {conf["values"]}\n')
+                        out_str.append(f'{indent}\tDescription: {conf.description}\n')
+                        out_str.append(f'{indent}\tDefault: {conf.default}\n')
+                        if conf.values:
+                            out_str.append(f'{indent}\tSuggested Values: {conf.values}\n')
 
             out_str.append('\n')
 
@@ -285,7 +287,7 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         workload_name = self.expander.workload_name
         if workload_name in self.workload_variables:
             for var, conf in self.workload_variables[workload_name].items():
-                if 'expandable' in conf and not conf['expandable']:
+                if not conf.expandable:
                     self.no_expand_vars.add(var)
 
         self.expander.set_no_expand_vars(self.no_expand_vars)
@@ -317,7 +319,7 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         self.experiment_tags = self.tags.copy()
 
         workload_name = self.expander.workload_name
-        self.experiment_tags.extend(self.workloads[workload_name]['tags'])
+        self.experiment_tags.extend(self.workloads[workload_name].tags)
 
         if tags:
             self.experiment_tags.extend(tags)
@@ -737,7 +739,7 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
     def _get_executable_graph(self, workload_name):
         """Return executables for add_expand_vars"""
         self._define_custom_executables()
-        exec_order = self.workloads[workload_name]['executables']
+        exec_order = self.workloads[workload_name].executables
         # Use yaml defined executable order, if defined
         if namespace.executables in self.internals:
             exec_order = self.internals[namespace.executables]
@@ -985,7 +987,7 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         for workload_name in workload_names:
             workload = self.workloads[workload_name]
 
-            for input_file in workload['inputs']:
+            for input_file in workload.inputs:
                 if input_file not in self.inputs:
                     logger.die(
                         f'Workload {workload_name} references a non-existent input file '
@@ -1409,18 +1411,38 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
                             if context_name not in fom_values:
                                 fom_values[context_name] = {}
 
-                    for fom in file_conf['foms']:
+                    # Only FOMs which can match the line's leading token are tested
+                    line_foms = file_conf['untokened_foms']
+                    if file_conf['foms_by_token']:
+                        line_tokens = line.split(None, 1)
+                        if line_tokens:
+                            line_foms = file_conf['foms_by_token'].get(line_tokens[0],
+                                                                       line_foms)
+
+                    # FOMs sharing a regex (or parser) only match it once per line
+                    line_matches = {}
+                    for fom in line_foms:
                         logger.debug(f'  Testing for fom {fom}')
                         fom_conf = foms[fom]
-                        fom_match = fom_conf['regex'].match(line)
-
-                        if fom_match:
-                            fom_vars = {}
-                            for k, v in fom_match.groupdict().items():
-                                fom_vars[k] = v
+                        fom_contains = fom_conf['contains']
+                        if fom_contains and not any(text in line for text in fom_contains):
+                            continue
+
+                        fom_parser = fom_conf['parser']
+                        fom_matcher = fom_parser if fom_parser else fom_conf['regex']
+                        if fom_matcher not in line_matches:
+                            if fom_parser:
+                                line_matches[fom_matcher] = fom_parser(line)
+                            else:
+                                fom_match = fom_matcher.match(line)
+                                line_matches[fom_matcher] = \
+                                    fom_match.groupdict() if fom_match else None
+                        fom_vars = line_matches[fom_matcher]
+
+                        if fom_vars is not None:
                             fom_name = self.expander.expand_var(fom, extra_vars=fom_vars)
 
-                            if fom_conf['group'] in fom_conf['regex'].groupindex:
+                            if fom_conf['group'] in fom_vars:
                                 logger.debug(' --- Matched fom %s' % fom_name)
                                 fom_contexts = []
                                 if fom_conf['contexts']:
@@ -1435,7 +1457,7 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
                                 for context in fom_contexts:
                                     if context not in fom_values:
                                         fom_values[context] = {}
-                                    fom_val = fom_match.group(fom_conf['group'])
+                                    fom_val = fom_vars[fom_conf['group']]
                                     fom_values[context][fom_name] = {
                                         'value': fom_val,
                                         'units': fom_conf['units'],
@@ -1666,7 +1688,9 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         return {
             'success_criteria': [],
             'contexts': [],
-            'foms': []
+            'foms': [],
+            'untokened_foms': [],
+            'foms_by_token': {}
         }
 
     def _analysis_dicts(self, criteria_list):
@@ -1736,11 +1760,17 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
             for fom, fom_def in mod.figures_of_merit.items():
                 fom_definitions[fom] = {'origin': f'{mod}', 'origin_type': 'modifier'}
                 for attr in fom_def.keys():
-                    if isinstance(fom_def[attr], list):
+                    if attr in self._fom_line_filter_attrs:
+                        fom_definitions[fom][attr] = self._analysis_strings(fom_def[attr],
+                                                                            mod_vars)
+                    elif isinstance(fom_def[attr], list):
                         fom_definitions[fom][attr] = fom_def[attr].copy()
-                    else:
+                    elif isinstance(fom_def[attr], six.string_types):
                         fom_definitions[fom][attr] = self.expander.expand_var(fom_def[attr],
                                                                               mod_vars)
+                    else:
+                        # Compiled regexes, parsers, and unset values are used as-is
+                        fom_definitions[fom][attr] = fom_def[attr]
 
         for fom, conf in fom_definitions.items():
             log_path = self.expander.expand_var(conf['log_file'])
@@ -1754,28 +1784,95 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
                     files[log_path]['contexts'].extend(conf['contexts'])
                 files[log_path]['foms'].append(fom)
 
+            if conf['origin_type'] == 'application':
+                fom_contains = self._analysis_strings(conf.get('contains'))
+                fom_tokens = self._analysis_strings(conf.get('leading_token'))
+            else:
+                # Modifier FOMs were expanded with their modifier's variables
+                fom_contains = conf.get('contains')
+                fom_tokens = conf.get('leading_token')
+
             foms[fom] = {
-                'regex': re.compile(r'%s' % self.expander.expand_var(conf['regex'])),
+                'regex': None,
+                'parser': conf.get('parser'),
+                'contains': fom_contains,
+                'leading_tokens': fom_tokens,
                 'contexts': [],
                 'group': conf['group_name'],
                 'units': conf['units'],
                 'origin': conf['origin'],
                 'origin_type': conf['origin_type']
             }
+            if not foms[fom]['parser']:
+                foms[fom]['regex'] = self._analysis_regex(conf['regex'])
             if conf['contexts']:
                 foms[fom]['contexts'].extend(conf['contexts'])
                 for context in conf['contexts']:
-                    regex_str = \
-                        self.expander.expand_var(fom_contexts[context]['regex'])
                     format_str = \
                         fom_contexts[context]['output_format']
                     contexts[context] = {
-                        'regex': re.compile(r'%s' % regex_str),
+                        'regex': self._analysis_regex(fom_contexts[context]['regex']),
                         'format': format_str
                     }
 
+        # Index the FOMs of each file by the leading token of lines they can
+        # match. FOMs without a leading token are candidates for every line.
+        for file_conf in files.values():
+            for fom in file_conf['foms']:
+                for token in foms[fom]['leading_tokens'] or []:
+                    file_conf['foms_by_token'][token] = []
+
+            for fom in file_conf['foms']:
+                fom_tokens = foms[fom]['leading_tokens']
+                if not fom_tokens:
+                    file_conf['untokened_foms'].append(fom)
+                for token, token_foms in file_conf['foms_by_token'].items():
+                    if not fom_tokens or token in fom_tokens:
+                        token_foms.append(fom)
+
         return files, contexts, foms
 
+    def _analysis_strings(self, strings, extra_vars=None):
+        """Return an expanded list of strings for analysis
+
+        Leading whitespace is significant when filtering log lines, so it is
+        kept even though expand_var strips it.
+
+        Args:
+            strings (str or list(str)): String, or list of strings, to expand
+            extra_vars (dict): Additional variables to use in expansion
+
+        Returns:
+            (list(str)): Expanded strings, or None if strings is not set
+        """
+        if not strings:
+            return None
+        if isinstance(strings, six.string_types):
+            strings = [strings]
+
+        expanded = []
+        for text in strings:
+            leading_space = text[:len(text) - len(text.lstrip())]
+            expanded.append(leading_space + self.expander.expand_var(text, extra_vars))
+        return expanded
+
+    def _analysis_regex(self, regex):
+        """Return a compiled regular expression for analysis
+
+        Regular expressions given as strings are expanded, then compiled.
+        Precompiled patterns (from application or modifier definitions) are
+        returned unmodified, to avoid compiling them for every experiment.
+
+        Args:
+            regex (str or re.Pattern): Regular expression to compile
+
+        Returns:
+            (re.Pattern): Compiled regular expression
+        """
+        if isinstance(regex, re.Pattern):
+            return regex
+        return re.compile(r'%s' % self.expander.expand_var(regex))
+
     def read_status(self):
         """Read status from an experiment's status file, if possible.
 
@@ -7,11 +7,12 @@
 # except according to those terms.
 
 import ramble.language.language_base
-from ramble.language.language_base import DirectiveError
+from ramble.language.language_base import DirectiveError, DirectiveWorkItem
 import ramble.language.shared_language
 from ramble.schema.types import OUTPUT_CAPTURE
 import ramble.language.language_helpers
 import ramble.success_criteria
+import ramble.workload
 
 
 """This package contains directives that can be used within a package.
@@ -52,6 +53,10 @@ class ApplicationMeta(ramble.language.shared_language.SharedMeta):
 application_directive = ApplicationMeta.directive
 
 
+# Directives return DirectiveWorkItems, which call the module level
+# _execute_* handlers below with the directive's normalized arguments.
+
+
 @application_directive('workloads')
 def workload(name, executables=None, executable=None, input=None,
              inputs=None, tags=None, **kwargs):
@@ -69,33 +74,30 @@ def workload(name, executables=None, executable=None, input=None,
     Either executable, or executables is a required input argument.
     """
 
-    def _execute_workload(app):
-        app.workloads[name] = {
-            'executables': [],
-            'inputs': [],
-            'tags': [],
-        }
-
-        all_execs = ramble.language.language_helpers.require_definition(executable,
-                                                                        executables,
-                                                                        'executable',
-                                                                        'executables',
-                                                                        'workload')
+    # Normalize definitions once, when the directive is called, so executing
+    # the directive only needs to store them. The helpers return new tuples,
+    # so no additional copies are needed.
+    all_execs = ramble.language.language_helpers.require_definition(executable,
+                                                                    executables,
+                                                                    'executable',
+                                                                    'executables',
+                                                                    'workload')
 
-        app.workloads[name]['executables'] = all_execs.copy()
+    all_inputs = ramble.language.language_helpers.merge_definitions(input, inputs)
 
-        all_inputs = ramble.language.language_helpers.merge_definitions(input, inputs)
+    all_tags = tuple(tags) if tags else ()
 
-        app.workloads[name]['inputs'] = all_inputs.copy()
+    return DirectiveWorkItem(_execute_workload, name, all_execs, all_inputs, all_tags)
 
-        if tags:
-            app.workloads[name]['tags'] = tags.copy()
 
-    return _execute_workload
+def _execute_workload(app, name, all_execs, all_inputs, all_tags):
+    app.workloads[name] = ramble.workload.Workload(executables=all_execs,
+                                                   inputs=all_inputs,
+                                                   tags=all_tags)
 
 
 @application_directive('executables')
-def executable(name, template, use_mpi=False, variables={}, redirect='{log_file}',
+def executable(name, template, use_mpi=False, variables=None, redirect='{log_file}',
                output_capture=OUTPUT_CAPTURE.DEFAULT, **kwargs):
     """Adds an executable to this application
 
@@ -117,13 +119,15 @@ def executable(name, template, use_mpi=False, variables={}, redirect='{log_file}
 
     """
 
-    def _execute_executable(app):
-        from ramble.util.executable import CommandExecutable
-        app.executables[name] = CommandExecutable(
-            name=name, template=template, use_mpi=use_mpi, redirect=redirect,
-            output_capture=output_capture)
+    return DirectiveWorkItem(_execute_executable, name, template, use_mpi,
+                             variables, redirect, output_capture)
 
-    return _execute_executable
+
+def _execute_executable(app, name, template, use_mpi, variables, redirect, output_capture):
+    from ramble.util.executable import CommandExecutable
+    app.executables[name] = CommandExecutable(
+        name=name, template=template, use_mpi=use_mpi, variables=variables,
+        redirect=redirect, output_capture=output_capture)
 
 
 @application_directive('inputs')
@@ -146,17 +150,19 @@ def input_file(name, url, description, target_dir='{input_name}', sha256=None, e
         expand (Optional): Whether the input should be expanded or not. Defaults to True
     """
 
-    def _execute_input_file(app):
-        app.inputs[name] = {
-            'url': url,
-            'description': description,
-            'target_dir': target_dir,
-            'sha256': sha256,
-            'extension': extension,
-            'expand': expand
-        }
+    return DirectiveWorkItem(_execute_input_file, name, url, description, target_dir,
+                             sha256, extension, expand)
 
-    return _execute_input_file
+
+def _execute_input_file(app, name, url, description, target_dir, sha256, extension, expand):
+    app.inputs[name] = {
+        'url': url,
+        'description': description,
+        'target_dir': target_dir,
+        'sha256': sha256,
+        'extension': extension,
+        'expand': expand
+    }
 
 
 @application_directive('workload_variables')
@@ -171,26 +177,30 @@ def workload_variable(name, default, description, values=None, workload=None,
     These are specific to each workload.
     """
 
-    def _execute_workload_variable(app):
-        all_workloads = ramble.language.language_helpers.require_definition(workload,
-                                                                            workloads,
-                                                                            'workload',
-                                                                            'workloads',
-                                                                            'workload_variable')
+    wl_names = ramble.language.language_helpers.require_definition(workload,
+                                                                   workloads,
+                                                                   'workload',
+                                                                   'workloads',
+                                                                   'workload_variable')
+    all_workloads = tuple(ramble.language.language_helpers.intern_definition(wl_name)
+                          for wl_name in wl_names)
+
+    return DirectiveWorkItem(_execute_workload_variable, name, default, description,
+                             values, all_workloads, expandable)
 
-        for wl_name in all_workloads:
-            if wl_name not in app.workload_variables:
-                app.workload_variables[wl_name] = {}
 
-            app.workload_variables[wl_name][name] = {
-                'default': default,
-                'description': description,
-                'expandable': expandable
-            }
-            if values:
-                app.workload_variables[wl_name][name]['values'] = values
+def _execute_workload_variable(app, name, default, description, values, all_workloads,
+                               expandable):
+    for wl_name in all_workloads:
+        if wl_name not in app.workload_variables:
+            app.workload_variables[wl_name] = {}
 
-    return _execute_workload_variable
+        # Each workload gets its own definition, so it can be modified
+        # without affecting other workloads
+        app.workload_variables[wl_name][name] = \
+            ramble.workload.WorkloadVariable(default, description,
+                                             expandable=expandable,
+                                             values=values if values else None)
 
 
 @application_directive('environment_variables')
@@ -201,24 +211,28 @@ def environment_variable(name, value, description, workload=None,
     These can be specific to workloads.
     """
 
-    def _execute_environment_variable(app):
-        all_workloads = ramble.language.language_helpers.require_definition(workload,
-                                                                            workloads,
-                                                                            'workload',
-                                                                            'workloads',
-                                                                            'environment_variable')
+    wl_names = ramble.language.language_helpers.require_definition(workload,
+                                                                   workloads,
+                                                                   'workload',
+                                                                   'workloads',
+                                                                   'environment_variable')
+    all_workloads = tuple(ramble.language.language_helpers.intern_definition(wl_name)
+                          for wl_name in wl_names)
+
+    return DirectiveWorkItem(_execute_environment_variable, name, value, description,
+                             all_workloads)
 
-        for wl_name in all_workloads:
-            if wl_name not in app.environment_variables:
-                app.environment_variables[wl_name] = {}
 
-            app.environment_variables[wl_name][name] = {
-                'value': value,
-                'action': 'set',
-                'description': description,
-            }
+def _execute_environment_variable(app, name, value, description, all_workloads):
+    for wl_name in all_workloads:
+        if wl_name not in app.environment_variables:
+            app.environment_variables[wl_name] = {}
 
-    return _execute_environment_variable
+        app.environment_variables[wl_name][name] = {
+            'value': value,
+            'action': 'set',
+            'description': description,
+        }
 
 
 @application_directive('phase_definitions')
@@ -241,45 +255,46 @@ def register_phase(name, pipeline=None, run_before=[], run_after=[]):
     - run_after: A list of phase names this phase should run after
     """
 
-    def _execute_register_phase(app):
-        import ramble.util.graph
-        if pipeline not in app._pipelines:
-            raise DirectiveError('Directive register_phase was '
-                                 f'given an invalid pipeline "{pipeline}"\n'
-                                 'Available pipelines are: '
-                                 f' {app._pipelines}')
+    return DirectiveWorkItem(_execute_register_phase, name, pipeline, run_before, run_after)
+
 
-        if not isinstance(run_before, list):
-            raise DirectiveError('Directive register_phase was '
-                                 'given an invalid type for '
-                                 'the run_before attribute in application '
-                                 f'{app.name}')
+def _execute_register_phase(app, name, pipeline, run_before, run_after):
+    import ramble.util.graph
+    if pipeline not in app._pipelines:
+        raise DirectiveError('Directive register_phase was '
+                             f'given an invalid pipeline "{pipeline}"\n'
+                             'Available pipelines are: '
+                             f' {app._pipelines}')
 
-        if not isinstance(run_after, list):
-            raise DirectiveError('Directive register_phase was '
-                                 'given an invalid type for '
-                                 'the run_after attribute in application '
-                                 f'{app.name}')
+    if not isinstance(run_before, list):
+        raise DirectiveError('Directive register_phase was '
+                             'given an invalid type for '
+                             'the run_before attribute in application '
+                             f'{app.name}')
 
-        if not hasattr(app, f'_{name}'):
-            raise DirectiveError('Directive register_phase was '
-                                 f'given an undefined phase {name} '
-                                 f'in application {app.name}')
+    if not isinstance(run_after, list):
+        raise DirectiveError('Directive register_phase was '
+                             'given an invalid type for '
+                             'the run_after attribute in application '
+                             f'{app.name}')
 
-        if pipeline not in app.phase_definitions:
-            app.phase_definitions[pipeline] = {}
+    if not hasattr(app, f'_{name}'):
+        raise DirectiveError('Directive register_phase was '
+                             f'given an undefined phase {name} '
+                             f'in application {app.name}')
 
-        if name in app.phase_definitions[pipeline]:
-            phase_node = app.phase_definitions[pipeline][name]
-        else:
-            phase_node = ramble.util.graph.GraphNode(name)
+    if pipeline not in app.phase_definitions:
+        app.phase_definitions[pipeline] = {}
 
-        for before in run_before:
-            phase_node.order_before(before)
+    if name in app.phase_definitions[pipeline]:
+        phase_node = app.phase_definitions[pipeline][name]
+    else:
+        phase_node = ramble.util.graph.GraphNode(name)
 
-        for after in run_after:
-            phase_node.order_after(after)
+    for before in run_before:
+        phase_node.order_before(before)
 
-        app.phase_definitions[pipeline][name] = phase_node
+    for after in run_after:
+        phase_node.order_after(after)
 
-    return _execute_register_phase
+    app.phase_definitions[pipeline][name] = phase_node
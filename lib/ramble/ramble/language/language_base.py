@@ -26,7 +26,7 @@ else:
     from collections import Sequence
 
 
-__all__ = ['DirectiveMeta', 'DirectiveError']
+__all__ = ['DirectiveMeta', 'DirectiveError', 'DirectiveWorkItem']
 
 
 #: These are variant names used by ramble internally; applications can't use
@@ -36,6 +36,27 @@ reserved_names = []
 namespaces = ['ramble.app', 'ramble.mod']
 
 
+class DirectiveWorkItem(object):
+    """Deferred execution of a directive
+
+    Holds a module level handler, and the arguments it should be called with,
+    until the directive is executed on a class. Directives can return a work
+    item instead of a closure to avoid creating a function object and its
+    closure cells for every directive call.
+
+    Work items are executed the same way as closures, by calling them with the
+    object the directive applies to. This results in `handler(obj, *args)`.
+    """
+    __slots__ = ('handler', 'args')
+
+    def __init__(self, handler, *args):
+        self.handler = handler
+        self.args = args
+
+    def __call__(self, obj):
+        return self.handler(obj, *self.args)
+
+
 class DirectiveMeta(type):
     """Flushes the directives that were temporarily stored in the staging
     area into the package.
@@ -6,6 +6,8 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import sys
+
 import six
 
 from ramble.language.language_base import DirectiveError
@@ -17,23 +19,28 @@ def merge_definitions(single_type, multiple_type):
     This method will merge two optional definitions of single_type and
     multiple_type.
 
+    The result is always a newly created tuple, which does not share storage
+    with multiple_type. Callers can store it directly, without copying it.
+
     Args:
         single_type: Single string for type name
         multiple_type: List of strings for type names
 
     Returns:
-        List of all type names (Merged if both single_type and multiple_type definitions are valid)
+        Tuple of all type names (Merged if both single_type and multiple_type
+        definitions are valid)
     """
 
-    all_types = []
+    if single_type and multiple_type:
+        return (single_type, *multiple_type)
 
     if single_type:
-        all_types.append(single_type)
+        return (single_type, )
 
     if multiple_type:
-        all_types.extend(multiple_type)
+        return tuple(multiple_type)
 
-    return all_types
+    return ()
 
 
 def require_definition(single_type, multiple_type,
@@ -54,7 +61,7 @@ def require_definition(single_type, multiple_type,
         directive_name: Name of the directive requiring a type
 
     Returns:
-        List of all type names (Merged if both single_type and multiple_type definitions are valid)
+        Tuple of all type names, as returned by merge_definitions
     """
 
     if not (single_type or multiple_type):
@@ -72,3 +79,22 @@ def require_definition(single_type, multiple_type,
                              f'Type was {type(multiple_type)}')
 
     return merge_definitions(single_type, multiple_type)
+
+
+def intern_definition(value):
+    """Intern a string used in a directive definition
+
+    Strings such as workload names and units are repeated across many
+    directive calls. Interning them ensures all definitions share a single
+    object, and speeds up dictionary lookups using them as keys.
+
+    Args:
+        value: Value to intern
+
+    Returns:
+        The interned string if value is a string, otherwise value unchanged
+    """
+
+    if isinstance(value, six.string_types):
+        return sys.intern(value)
+    return value
@@ -12,6 +12,7 @@ except ImportError:
     print('Please use pip to install the requirements.txt')
 
 import ramble.language.language_base
+from ramble.language.language_base import DirectiveWorkItem
 import ramble.language.language_helpers
 import ramble.success_criteria
 from ramble.util.logger import logger
@@ -44,6 +45,10 @@ class SharedMeta(ramble.language.language_base.DirectiveMeta):
 shared_directive = SharedMeta.directive
 
 
+# Directives return DirectiveWorkItems, which call the module level
+# _execute_* handlers below with the directive's normalized arguments.
+
+
 @shared_directive('archive_patterns')
 def archive_pattern(pattern):
     """Adds a file pattern to be archived in addition to figure of merit logs
@@ -56,10 +61,11 @@ def archive_pattern(pattern):
       pattern: Pattern that refers to files to archive
     """
 
-    def _execute_archive_pattern(obj):
-        obj.archive_patterns[pattern] = pattern
+    return DirectiveWorkItem(_execute_archive_pattern, pattern)
 
-    return _execute_archive_pattern
+
+def _execute_archive_pattern(obj, pattern):
+    obj.archive_patterns[pattern] = pattern
 
 
 @shared_directive('figure_of_merit_contexts')
@@ -72,22 +78,33 @@ def figure_of_merit_context(name, regex, output_format):
       name: High level name of the context. Can be referred to in
             the figure of merit
       regex: Regular expression, using group names, to match a context.
+             May be a string, or an already compiled `re.Pattern`.
       output_format: String, using python keywords {group_name} to extract
                      group names from context regular expression.
     """
 
-    def _execute_figure_of_merit_context(obj):
-        obj.figure_of_merit_contexts[name] = {
-            'regex': regex,
-            'output_format': output_format
-        }
+    return DirectiveWorkItem(_execute_figure_of_merit_context, name, regex, output_format)
+
+
+def _execute_figure_of_merit_context(obj, name, regex, output_format):
+    obj.figure_of_merit_contexts[name] = {
+        'regex': regex,
+        'output_format': output_format
+    }
+
 
-    return _execute_figure_of_merit_context
+def _validate_fom_extractor(fom_regex, parser, directive_name):
+    """Ensure exactly one of fom_regex or parser is given to a FOM directive"""
+    if (fom_regex is None) == (parser is None):
+        raise ramble.language.language_base.DirectiveError(
+            f'Directive {directive_name} requires exactly one of '
+            'fom_regex or parser to be defined.'
+        )
 
 
 @shared_directive('figures_of_merit')
-def figure_of_merit(name, fom_regex, group_name, log_file='{log_file}', units='',
-                    contexts=[]):
+def figure_of_merit(name, fom_regex=None, group_name=None, log_file='{log_file}', units='',
+                    contexts=[], parser=None, contains=None, leading_token=None):
     """Adds a figure of merit to track for this object
 
     Defines a new figure of merit.
@@ -95,22 +112,92 @@ def figure_of_merit(name, fom_regex, group_name, log_file='{log_file}', units=''
     Args:
       name: High level name of the figure of merit
       log_file: File the figure of merit can be extracted from
-      fom_regex: A regular expression using named groups to extract the FOM
-      group_name: The name of the group that the FOM should be pulled from
+      fom_regex: A regular expression using named groups to extract the FOM.
+                 May be a string, or an already compiled `re.Pattern`. Compiled
+                 patterns are used as-is, without variable expansion.
+      group_name: The name of the group that the FOM should be pulled from.
+                  Required. It only has a default so that fom_regex can be
+                  omitted when a parser is given.
       units: The units associated with the FOM
+      parser: A function used instead of fom_regex, for lines with a simple
+              fixed format. It is called as `parser(line)` and returns None if
+              the line does not match, or a dict mapping group names to values.
+      contains: A string, or list of strings, which a line must contain (at
+                least one of) to be a candidate for this FOM. Lines without
+                them are skipped before fom_regex or parser are tried.
+                Variables in the strings are expanded before analysis.
+      leading_token: A string, or list of strings, one of which must be the
+                     first whitespace delimited token of a line for it to be
+                     a candidate for this FOM. Log lines are dispatched to
+                     FOMs by their first token with a single dict lookup.
+                     Variables in the strings are expanded before analysis.
     """
 
-    def _execute_figure_of_merit(obj):
+    _validate_fom_extractor(fom_regex, parser, 'figure_of_merit')
+
+    if group_name is None:
+        raise ramble.language.language_base.DirectiveError(
+            'Directive figure_of_merit requires group_name to be defined.'
+        )
+
+    group_foms = ((name,
+                   ramble.language.language_helpers.intern_definition(group_name),
+                   ramble.language.language_helpers.intern_definition(units)), )
+
+    return DirectiveWorkItem(_execute_figures_of_merit, group_foms, fom_regex, log_file,
+                             contexts, parser, contains, leading_token)
+
+
+@shared_directive('figures_of_merit')
+def figure_of_merit_group(foms, fom_regex=None, log_file='{log_file}', contexts=[],
+                          parser=None, contains=None, leading_token=None):
+    """Adds a group of figures of merit sharing one regular expression
+
+    Defines several figures of merit which are extracted from the same
+    regular expression (or parser). Each line of the log file is only matched
+    against the expression once, and every figure of merit in the group is
+    pulled from the same match.
+
+    Args:
+      foms: A list of (name, group_name, units) tuples, one per figure of merit
+      fom_regex: A regular expression using named groups to extract the FOMs.
+                 May be a string, or an already compiled `re.Pattern`.
+      log_file: File the figures of merit can be extracted from
+      contexts: List of contexts the figures of merit belong to
+      parser: A function used instead of fom_regex. See `figure_of_merit`.
+      contains: Substring prefilter for candidate lines. See `figure_of_merit`.
+      leading_token: First token dispatch for candidate lines. See
+                     `figure_of_merit`.
+    """
+
+    _validate_fom_extractor(fom_regex, parser, 'figure_of_merit_group')
+
+    group_foms = tuple(
+        (name,
+         ramble.language.language_helpers.intern_definition(group_name),
+         ramble.language.language_helpers.intern_definition(units))
+        for name, group_name, units in foms
+    )
+
+    return DirectiveWorkItem(_execute_figures_of_merit, group_foms, fom_regex, log_file,
+                             contexts, parser, contains, leading_token)
+
+
+def _execute_figures_of_merit(obj, group_foms, fom_regex, log_file, contexts, parser,
+                              contains, leading_token):
+    # Shared by figure_of_merit and figure_of_merit_group
+    for name, group_name, units in group_foms:
         obj.figures_of_merit[name] = {
             'log_file': log_file,
             'regex': fom_regex,
+            'parser': parser,
+            'contains': contains,
+            'leading_token': leading_token,
             'group_name': group_name,
             'units': units,
             'contexts': contexts
         }
 
-    return _execute_figure_of_merit
-
 
 @shared_directive('compilers')
 @deprecation.deprecated(deprecated_in="0.4.0", removed_in="0.5.0",
@@ -119,16 +206,17 @@ def figure_of_merit(name, fom_regex, group_name, log_file='{log_file}', units=''
 def default_compiler(name, spack_spec, compiler_spec=None, compiler=None):
     """Deprecated: See `define_compiler` instead"""
 
-    def _execute_default_compiler(obj):
-        logger.warn(f'Use of deprecated directive `default_compiler` in {obj.name}')
-        if hasattr(obj, 'uses_spack') and getattr(obj, 'uses_spack'):
-            obj.compilers[name] = {
-                'spack_spec': spack_spec,
-                'compiler_spec': compiler_spec,
-                'compiler': compiler
-            }
+    return DirectiveWorkItem(_execute_default_compiler, name, spack_spec, compiler_spec, compiler)
+
 
-    return _execute_default_compiler
+def _execute_default_compiler(obj, name, spack_spec, compiler_spec, compiler):
+    logger.warn(f'Use of deprecated directive `default_compiler` in {obj.name}')
+    if hasattr(obj, 'uses_spack') and getattr(obj, 'uses_spack'):
+        obj.compilers[name] = {
+            'spack_spec': spack_spec,
+            'compiler_spec': compiler_spec,
+            'compiler': compiler
+        }
 
 
 @shared_directive('compilers')
@@ -139,15 +227,16 @@ def define_compiler(name, spack_spec, compiler_spec=None, compiler=None):
     reference a compiler that has been added.
     """
 
-    def _execute_define_compiler(obj):
-        if hasattr(obj, 'uses_spack') and getattr(obj, 'uses_spack'):
-            obj.compilers[name] = {
-                'spack_spec': spack_spec,
-                'compiler_spec': compiler_spec,
-                'compiler': compiler
-            }
+    return DirectiveWorkItem(_execute_define_compiler, name, spack_spec, compiler_spec, compiler)
 
-    return _execute_define_compiler
+
+def _execute_define_compiler(obj, name, spack_spec, compiler_spec, compiler):
+    if hasattr(obj, 'uses_spack') and getattr(obj, 'uses_spack'):
+        obj.compilers[name] = {
+            'spack_spec': spack_spec,
+            'compiler_spec': compiler_spec,
+            'compiler': compiler
+        }
 
 
 @shared_directive('software_specs')
@@ -164,17 +253,18 @@ def software_spec(name, spack_spec, compiler_spec=None, compiler=None):
     environment.
     """
 
-    def _execute_software_spec(obj):
-        if hasattr(obj, 'uses_spack') and getattr(obj, 'uses_spack'):
+    return DirectiveWorkItem(_execute_software_spec, name, spack_spec, compiler_spec, compiler)
+
 
-            # Define the spec
-            obj.software_specs[name] = {
-                'spack_spec': spack_spec,
-                'compiler_spec': compiler_spec,
-                'compiler': compiler
-            }
+def _execute_software_spec(obj, name, spack_spec, compiler_spec, compiler):
+    if hasattr(obj, 'uses_spack') and getattr(obj, 'uses_spack'):
 
-    return _execute_software_spec
+        # Define the spec
+        obj.software_specs[name] = {
+            'spack_spec': spack_spec,
+            'compiler_spec': compiler_spec,
+            'compiler': compiler
+        }
 
 
 @shared_directive('package_manager_configs')
@@ -186,10 +276,11 @@ def package_manager_config(name, config, **kwargs):
     which will control the logic of applying it.
     """
 
-    def _execute_package_manager_config(obj):
-        obj.package_manager_configs[name] = config
+    return DirectiveWorkItem(_execute_package_manager_config, name, config)
+
 
-    return _execute_package_manager_config
+def _execute_package_manager_config(obj, name, config):
+    obj.package_manager_configs[name] = config
 
 
 @shared_directive('required_packages')
@@ -198,10 +289,11 @@ def required_package(name):
     to function properly.
     """
 
-    def _execute_required_package(obj):
-        obj.required_packages[name] = True
+    return DirectiveWorkItem(_execute_required_package, name)
+
 
-    return _execute_required_package
+def _execute_required_package(obj, name):
+    obj.required_packages[name] = True
 
 
 @shared_directive('success_criteria')
@@ -228,21 +320,23 @@ def success_criteria(name, mode, match=None, file='{log_file}',
                '{value}' keyword is set as the value of the FOM.
     """
 
-    def _execute_success_criteria(obj):
-        valid_modes = ramble.success_criteria.SuccessCriteria._valid_modes
-        if mode not in valid_modes:
-            logger.die(f'Mode {mode} is not valid. Valid values are {valid_modes}')
-
-        obj.success_criteria[name] = {
-            'mode': mode,
-            'match': match,
-            'file': file,
-            'fom_name': fom_name,
-            'fom_context': fom_context,
-            'formula': formula
-        }
+    return DirectiveWorkItem(_execute_success_criteria, name, mode, match, file, fom_name,
+                             fom_context, formula)
+
+
+def _execute_success_criteria(obj, name, mode, match, file, fom_name, fom_context, formula):
+    valid_modes = ramble.success_criteria.SuccessCriteria._valid_modes
+    if mode not in valid_modes:
+        logger.die(f'Mode {mode} is not valid. Valid values are {valid_modes}')
 
-    return _execute_success_criteria
+    obj.success_criteria[name] = {
+        'mode': mode,
+        'match': match,
+        'file': file,
+        'fom_name': fom_name,
+        'fom_context': fom_context,
+        'formula': formula
+    }
 
 
 @shared_directive('builtins')
@@ -287,23 +381,27 @@ def register_builtin(name, required=True, injection_method='prepend', depends_on
     - 'prepend' -- This builtin will be injected at the beginning of the executable list
     - 'append' -- This builtin will be injected at the end of the executable list
     """
+
+    return DirectiveWorkItem(_execute_register_builtin, name, required, injection_method,
+                             depends_on)
+
+
+def _execute_register_builtin(obj, name, required, injection_method, depends_on):
     supported_injection_methods = ['prepend', 'append']
 
-    def _store_builtin(obj):
-        if injection_method not in supported_injection_methods:
-            raise ramble.language.language_base.DirectiveError(
-                f'Object {obj.name} defines builtin {name} with an invalid '
-                f'injection method of {injection_method}.\n'
-                f'Valid methods are {str(supported_injection_methods)}'
-            )
+    if injection_method not in supported_injection_methods:
+        raise ramble.language.language_base.DirectiveError(
+            f'Object {obj.name} defines builtin {name} with an invalid '
+            f'injection method of {injection_method}.\n'
+            f'Valid methods are {str(supported_injection_methods)}'
+        )
 
-        builtin_name = obj._builtin_name.format(obj_name=obj.name, name=name)
+    builtin_name = obj._builtin_name.format(obj_name=obj.name, name=name)
 
-        obj.builtins[builtin_name] = {'name': name,
-                                      'required': required,
-                                      'injection_method': injection_method,
-                                      'depends_on': depends_on.copy()}
-    return _store_builtin
+    obj.builtins[builtin_name] = {'name': name,
+                                  'required': required,
+                                  'injection_method': injection_method,
+                                  'depends_on': depends_on.copy()}
 
 
 @shared_directive('phase_definitions')
@@ -326,56 +424,57 @@ def register_phase(name, pipeline=None, run_before=[], run_after=[]):
     - run_after: A list of phase names this phase should run after
     """
 
-    def _execute_register_phase(obj):
-        import ramble.util.graph
-        if pipeline not in obj._pipelines:
-            raise ramble.language.language_base.DirectiveError(
-                'Directive register_phase was '
-                f'given an invalid pipeline "{pipeline}"\n'
-                'Available pipelines are: '
-                f' {obj._pipelines}'
-            )
-
-        if not isinstance(run_before, list):
-            raise ramble.language.language_base.DirectiveError(
-                'Directive register_phase was '
-                'given an invalid type for '
-                'the run_before attribute in object '
-                f'{obj.name}'
-            )
-
-        if not isinstance(run_after, list):
-            raise ramble.language.language_base.DirectiveError(
-                'Directive register_phase was '
-                'given an invalid type for '
-                'the run_after attribute in object '
-                f'{obj.name}'
-            )
-
-        if not hasattr(obj, f'_{name}'):
-            raise ramble.language.language_base.DirectiveError(
-                'Directive register_phase was '
-                f'given an undefined phase {name} '
-                f'in object {obj.name}'
-            )
-
-        if pipeline not in obj.phase_definitions:
-            obj.phase_definitions[pipeline] = {}
-
-        if name in obj.phase_definitions[pipeline]:
-            phase_node = obj.phase_definitions[pipeline][name]
-        else:
-            phase_node = ramble.util.graph.GraphNode(name)
-
-        for before in run_before:
-            phase_node.order_before(before)
-
-        for after in run_after:
-            phase_node.order_after(after)
-
-        obj.phase_definitions[pipeline][name] = phase_node
-
-    return _execute_register_phase
+    return DirectiveWorkItem(_execute_register_phase, name, pipeline, run_before, run_after)
+
+
+def _execute_register_phase(obj, name, pipeline, run_before, run_after):
+    import ramble.util.graph
+    if pipeline not in obj._pipelines:
+        raise ramble.language.language_base.DirectiveError(
+            'Directive register_phase was '
+            f'given an invalid pipeline "{pipeline}"\n'
+            'Available pipelines are: '
+            f' {obj._pipelines}'
+        )
+
+    if not isinstance(run_before, list):
+        raise ramble.language.language_base.DirectiveError(
+            'Directive register_phase was '
+            'given an invalid type for '
+            'the run_before attribute in object '
+            f'{obj.name}'
+        )
+
+    if not isinstance(run_after, list):
+        raise ramble.language.language_base.DirectiveError(
+            'Directive register_phase was '
+            'given an invalid type for '
+            'the run_after attribute in object '
+            f'{obj.name}'
+        )
+
+    if not hasattr(obj, f'_{name}'):
+        raise ramble.language.language_base.DirectiveError(
+            'Directive register_phase was '
+            f'given an undefined phase {name} '
+            f'in object {obj.name}'
+        )
+
+    if pipeline not in obj.phase_definitions:
+        obj.phase_definitions[pipeline] = {}
+
+    if name in obj.phase_definitions[pipeline]:
+        phase_node = obj.phase_definitions[pipeline][name]
+    else:
+        phase_node = ramble.util.graph.GraphNode(name)
+
+    for before in run_before:
+        phase_node.order_before(before)
+
+    for after in run_after:
+        phase_node.order_after(after)
+
+    obj.phase_definitions[pipeline][name] = phase_node
 
 
 @shared_directive(dicts=())
@@ -386,12 +485,13 @@ def maintainers(*names: str):
         names: GitHub username for the maintainer
     """
 
-    def _execute_maintainer(obj):
-        maintainers_from_base = getattr(obj, "maintainers", [])
-        # Here it is essential to copy, otherwise we might add to an empty list in the parent
-        obj.maintainers = list(sorted(set(maintainers_from_base + list(names))))
+    return DirectiveWorkItem(_execute_maintainer, names)
+
 
-    return _execute_maintainer
+def _execute_maintainer(obj, names):
+    maintainers_from_base = getattr(obj, "maintainers", [])
+    # Here it is essential to copy, otherwise we might add to an empty list in the parent
+    obj.maintainers = list(sorted(set(maintainers_from_base + list(names))))
 
 
 @shared_directive(dicts=())
@@ -402,9 +502,10 @@ def tags(*values: str):
         values: Value to mark as a tag
     """
 
-    def _execute_tag(obj):
-        tags_from_base = getattr(obj, "tags", [])
-        # Here it is essential to copy, otherwise we might add to an empty list in the parent
-        obj.tags = list(sorted(set(tags_from_base + list(values))))
+    return DirectiveWorkItem(_execute_tag, values)
+
 
-    return _execute_tag
+def _execute_tag(obj, values):
+    tags_from_base = getattr(obj, "tags", [])
+    # Here it is essential to copy, otherwise we might add to an empty list in the parent
+    obj.tags = list(sorted(set(tags_from_base + list(values))))
@@ -9,9 +9,14 @@
 
 import pytest
 import enum
+import re
+import sys
 import deprecation
 
 from ramble.appkit import *  # noqa
+import ramble.language.language_helpers
+from ramble.language.language_base import DirectiveError, DirectiveMeta, DirectiveWorkItem
+from ramble.workload import Workload, WorkloadVariable
 
 
 app_types = [
@@ -323,6 +328,136 @@ def test_workload_directive(app_class, func_type):
     for test in test_defs['inputs']:
         assert test in app_inst.workloads[wl_name]['inputs']
 
+    assert isinstance(app_inst.workloads[wl_name], Workload)
+    assert sorted(app_inst.workloads[wl_name].executables) == sorted(test_defs['executables'])
+    assert sorted(app_inst.workloads[wl_name].inputs) == sorted(test_defs['inputs'])
+
+
+@pytest.mark.parametrize('func_type', func_types)
+@pytest.mark.parametrize('app_class', app_types)
+def test_workload_variable_directive(app_class, func_type):
+    app_inst = app_class('/not/a/path')
+    wl_names = ['TestWorkload1', 'TestWorkload2']
+
+    if func_type == func_types.directive:
+        workload_variable('test_var', default='1', description='Test var',  # noqa: F405
+                          values=['1', '2'], workloads=wl_names)(app_inst)
+        workload_variable('no_expand_var', default='{a}', description='Raw var',  # noqa: F405
+                          expandable=False, workload=wl_names[0])(app_inst)
+    elif func_type == func_types.method:
+        app_inst.workload_variable('test_var', default='1', description='Test var',
+                                   values=['1', '2'], workloads=wl_names)
+        app_inst.workload_variable('no_expand_var', default='{a}', description='Raw var',
+                                   expandable=False, workload=wl_names[0])
+    else:
+        assert False
+
+    for wl_name in wl_names:
+        wl_var = app_inst.workload_variables[wl_name]['test_var']
+        assert isinstance(wl_var, WorkloadVariable)
+        assert wl_var.default == '1'
+        assert wl_var.description == 'Test var'
+        assert wl_var.expandable
+        assert wl_var.values == ['1', '2']
+
+    wl_var = app_inst.workload_variables[wl_names[0]]['no_expand_var']
+    assert not wl_var.expandable
+    assert wl_var.values is None
+    assert 'no_expand_var' not in app_inst.workload_variables[wl_names[1]]
+
+    # Dictionary style access is kept for existing application definitions
+    assert wl_var['default'] == '{a}'
+    assert 'description' in wl_var
+    assert 'values' not in wl_var
+    with pytest.raises(KeyError):
+        wl_var['values']
+
+    # Only unset values are treated as not present
+    none_var = WorkloadVariable(None, 'None default')
+    assert 'default' in none_var
+    assert none_var['default'] is None
+
+    # Modifying a variable of one workload does not change other workloads
+    app_inst.workload_variables[wl_names[0]]['test_var'].default = '2'
+    assert app_inst.workload_variables[wl_names[1]]['test_var'].default == '1'
+
+
+@pytest.mark.parametrize('app_class', app_types)
+def test_definition_strings_are_interned(app_class):
+    app_inst = app_class('/not/a/path')
+
+    # Build strings at runtime, so they are not interned by the compiler
+    wl_name = '-'.join(['interned', 'workload'])
+    units = '/'.join(['MB', 's'])
+
+    workload_variable('test_var', default='1', description='Test var',  # noqa: F405
+                      workload=wl_name)(app_inst)
+    environment_variable('TEST_VAR', value='1', description='Test var',  # noqa: F405
+                         workload=wl_name)(app_inst)
+    figure_of_merit('Rate', fom_regex=r'(?P<rate>[0-9]+)', group_name='rate',  # noqa: F405
+                    units=units)(app_inst)
+
+    interned_wl_name = sys.intern('interned-workload')
+    for wl_dict in [app_inst.workload_variables, app_inst.environment_variables]:
+        wl_keys = [key for key in wl_dict.keys() if key == wl_name]
+        assert wl_keys[0] is interned_wl_name
+    assert app_inst.figures_of_merit['Rate']['units'] is sys.intern('MB/s')
+
+
+@pytest.mark.parametrize('single,multiple,expected', [
+    ('a', ['b', 'c'], ('a', 'b', 'c')),
+    ('a', None, ('a', )),
+    (None, ['b', 'c'], ('b', 'c')),
+    (None, None, ()),
+])
+def test_merge_definitions_returns_new_tuple(single, multiple, expected):
+    merged = ramble.language.language_helpers.merge_definitions(single, multiple)
+    assert merged == expected
+    assert merged is not multiple
+
+
+def test_workload_definitions_validated_on_call():
+    with pytest.raises(DirectiveError):
+        workload('TestWorkload')  # noqa: F405
+
+    with pytest.raises(DirectiveError):
+        workload_variable('test_var', default='1', description='Test var')  # noqa: F405
+
+    with pytest.raises(DirectiveError):
+        environment_variable('TEST_VAR', value='1', description='Test var')  # noqa: F405
+
+
+@pytest.mark.parametrize('app_class', app_types)
+def test_application_directives_return_work_items(app_class):
+    app_inst = app_class('/not/a/path')
+
+    work_item = workload('TestWorkload', executable='foo')  # noqa: F405
+    # Executed directly, so remove it from the pending directives
+    DirectiveMeta._directives_to_be_executed.remove(work_item)
+
+    assert isinstance(work_item, DirectiveWorkItem)
+    assert not hasattr(work_item, '__dict__')
+
+    work_item(app_inst)
+    assert app_inst.workloads['TestWorkload'] == Workload(executables=('foo', ))
+
+    work_item = figure_of_merit('Time', fom_regex=r'(?P<time>[0-9]+)',  # noqa: F405
+                                group_name='time')
+    DirectiveMeta._directives_to_be_executed.remove(work_item)
+
+    assert isinstance(work_item, DirectiveWorkItem)
+
+    work_item(app_inst)
+    assert app_inst.figures_of_merit['Time']['group_name'] == 'time'
+
+    work_item = archive_pattern('{experiment_run_dir}/*.log')  # noqa: F405
+    DirectiveMeta._directives_to_be_executed.remove(work_item)
+
+    assert isinstance(work_item, DirectiveWorkItem)
+
+    work_item(app_inst)
+    assert '{experiment_run_dir}/*.log' in app_inst.archive_patterns
+
 
 @pytest.mark.parametrize('func_type', func_types)
 @pytest.mark.parametrize('app_class', app_types)
@@ -340,6 +475,26 @@ def test_executable_directive(app_class, func_type):
                                        conf_name)
 
 
+@pytest.mark.parametrize('func_type', func_types)
+@pytest.mark.parametrize('app_class', app_types)
+def test_executable_variables(app_class, func_type):
+    app_inst = app_class('/not/a/path')
+    exec_vars = {'n_threads': '4'}
+
+    if func_type == func_types.directive:
+        executable('VarsExe', 'app.x', variables=exec_vars)(app_inst)  # noqa: F405
+        executable('NoVarsExe', 'app.x')(app_inst)  # noqa: F405
+    elif func_type == func_types.method:
+        app_inst.executable('VarsExe', 'app.x', variables=exec_vars)
+        app_inst.executable('NoVarsExe', 'app.x')
+    else:
+        assert False
+
+    assert app_inst.executables['VarsExe'].variables == exec_vars
+    assert app_inst.executables['VarsExe'].variables is not exec_vars
+    assert app_inst.executables['NoVarsExe'].variables == {}
+
+
 @pytest.mark.parametrize('func_type', func_types)
 @pytest.mark.parametrize('app_class', app_types)
 def test_figure_of_merit_directive(app_class, func_type):
@@ -356,6 +511,140 @@ def test_figure_of_merit_directive(app_class, func_type):
                 == conf_val
 
 
+@pytest.mark.parametrize('func_type', func_types)
+@pytest.mark.parametrize('app_class', app_types)
+def test_figure_of_merit_compiled_regex(app_class, func_type):
+    app_inst = app_class('/not/a/path')
+    fom_regex = re.compile(r'Time:\s+(?P<time>[0-9]+)')
+
+    if func_type == func_types.directive:
+        figure_of_merit('Time', fom_regex=fom_regex, group_name='time',  # noqa: F405
+                        units='s')(app_inst)
+    elif func_type == func_types.method:
+        app_inst.figure_of_merit('Time', fom_regex=fom_regex, group_name='time',
+                                 units='s')
+    else:
+        assert False
+
+    assert app_inst.figures_of_merit['Time']['regex'] is fom_regex
+
+
+@pytest.mark.parametrize('func_type', func_types)
+@pytest.mark.parametrize('app_class', app_types)
+def test_figure_of_merit_group_directive(app_class, func_type):
+    app_inst = app_class('/not/a/path')
+    fom_regex = r'(?P<method>\w+):\s+(?P<rate>[0-9\.]+)\s+(?P<time>[0-9\.]+)'
+    group_foms = [('{method} rate', 'rate', 'MB/s'), ('{method} time', 'time', 's')]
+
+    if func_type == func_types.directive:
+        figure_of_merit_group(fom_regex=fom_regex, foms=group_foms)(app_inst)  # noqa: F405
+    elif func_type == func_types.method:
+        app_inst.figure_of_merit_group(fom_regex=fom_regex, foms=group_foms)
+    else:
+        assert False
+
+    for fom_name, group_name, units in group_foms:
+        assert fom_name in app_inst.figures_of_merit
+        fom_conf = app_inst.figures_of_merit[fom_name]
+        assert fom_conf['regex'] == fom_regex
+        assert fom_conf['group_name'] == group_name
+        assert fom_conf['units'] == units
+        assert fom_conf['log_file'] == '{log_file}'
+
+
+def parse_test_line(line):
+    tokens = line.split()
+    if len(tokens) != 2 or tokens[0] != 'Time:':
+        return None
+    return {'time': tokens[1]}
+
+
+@pytest.mark.parametrize('func_type', func_types)
+@pytest.mark.parametrize('app_class', app_types)
+def test_figure_of_merit_parser(app_class, func_type):
+    app_inst = app_class('/not/a/path')
+
+    if func_type == func_types.directive:
+        figure_of_merit('Time', parser=parse_test_line, group_name='time',  # noqa: F405
+                        units='s')(app_inst)
+    elif func_type == func_types.method:
+        app_inst.figure_of_merit('Time', parser=parse_test_line, group_name='time',
+                                 units='s')
+    else:
+        assert False
+
+    fom_conf = app_inst.figures_of_merit['Time']
+    assert fom_conf['parser'] is parse_test_line
+    assert fom_conf['regex'] is None
+    assert fom_conf['parser']('Time: 12') == {'time': '12'}
+    assert fom_conf['parser']('Size: 12') is None
+
+
+@pytest.mark.parametrize('func_type', func_types)
+@pytest.mark.parametrize('app_class', app_types)
+def test_figure_of_merit_contains(app_class, func_type):
+    app_inst = app_class('/not/a/path')
+    fom_regex = r'Time:\s+(?P<time>[0-9]+)'
+
+    if func_type == func_types.directive:
+        figure_of_merit('Time', fom_regex=fom_regex, group_name='time',  # noqa: F405
+                        contains='Time:')(app_inst)
+        figure_of_merit_group(foms=[('Group time', 'time', 's')],  # noqa: F405
+                              fom_regex=fom_regex,
+                              contains=['Time:', 'Elapsed:'])(app_inst)
+    elif func_type == func_types.method:
+        app_inst.figure_of_merit('Time', fom_regex=fom_regex, group_name='time',
+                                 contains='Time:')
+        app_inst.figure_of_merit_group(fom_regex=fom_regex, foms=[('Group time', 'time', 's')],
+                                       contains=['Time:', 'Elapsed:'])
+    else:
+        assert False
+
+    assert app_inst.figures_of_merit['Time']['contains'] == 'Time:'
+    assert app_inst.figures_of_merit['Group time']['contains'] == ['Time:', 'Elapsed:']
+
+
+@pytest.mark.parametrize('func_type', func_types)
+@pytest.mark.parametrize('app_class', app_types)
+def test_figure_of_merit_leading_token(app_class, func_type):
+    app_inst = app_class('/not/a/path')
+    fom_regex = r'Time:\s+(?P<time>[0-9]+)'
+
+    if func_type == func_types.directive:
+        figure_of_merit('Time', fom_regex=fom_regex, group_name='time',  # noqa: F405
+                        leading_token='Time:')(app_inst)
+        figure_of_merit_group(foms=[('Group time', 'time', 's')],  # noqa: F405
+                              fom_regex=fom_regex,
+                              leading_token=['Time:', 'Elapsed:'])(app_inst)
+    elif func_type == func_types.method:
+        app_inst.figure_of_merit('Time', fom_regex=fom_regex, group_name='time',
+                                 leading_token='Time:')
+        app_inst.figure_of_merit_group(fom_regex=fom_regex, foms=[('Group time', 'time', 's')],
+                                       leading_token=['Time:', 'Elapsed:'])
+    else:
+        assert False
+
+    assert app_inst.figures_of_merit['Time']['leading_token'] == 'Time:'
+    assert app_inst.figures_of_merit['Group time']['leading_token'] == ['Time:', 'Elapsed:']
+
+
+def test_figure_of_merit_requires_one_extractor():
+    with pytest.raises(DirectiveError):
+        figure_of_merit('Time', group_name='time')  # noqa: F405
+
+    with pytest.raises(DirectiveError):
+        figure_of_merit('Time', fom_regex=r'(?P<time>[0-9]+)',  # noqa: F405
+                        parser=parse_test_line, group_name='time')
+
+
+def test_figure_of_merit_requires_group_name():
+    with pytest.raises(DirectiveError):
+        figure_of_merit('Time', fom_regex=r'(?P<time>[0-9]+)')  # noqa: F405
+
+    with pytest.raises(DirectiveError):
+        figure_of_merit('Time', parser=parse_test_line)  # noqa: F405
+
+
 @pytest.mark.parametrize('func_type', func_types)
 @pytest.mark.parametrize('app_class', app_types)
 def test_input_file_directive(app_class, func_type):
@@ -9,7 +9,9 @@
 
 import pytest
 
+import ramble.success_criteria
 import ramble.workspace
+from ramble.workload import Workload
 
 pytestmark = pytest.mark.usefixtures('mutable_config',
                                      'mutable_mock_workspace_path',
@@ -44,16 +46,16 @@ def test_basic_app(mutable_mock_apps_repo):
     assert basic_inst.executables['bar'].mpi
 
     assert 'test_wl' in basic_inst.workloads
-    assert basic_inst.workloads['test_wl']['executables'] == ['foo']
-    assert basic_inst.workloads['test_wl']['inputs'] == ['input']
+    assert basic_inst.workloads['test_wl']['executables'] == ('foo',)
+    assert basic_inst.workloads['test_wl']['inputs'] == ('input',)
 
     exec_graph = basic_inst._get_executable_graph('test_wl')
     assert exec_graph.get_node('foo') is not None
     assert exec_graph.get_node('builtin::env_vars') is not None
 
     assert 'test_wl2' in basic_inst.workloads
-    assert basic_inst.workloads['test_wl2']['executables'] == ['bar']
-    assert basic_inst.workloads['test_wl2']['inputs'] == ['input']
+    assert basic_inst.workloads['test_wl2']['executables'] == ('bar',)
+    assert basic_inst.workloads['test_wl2']['inputs'] == ('input',)
 
     exec_graph = basic_inst._get_executable_graph('test_wl2')
     assert exec_graph.get_node('bar') is not None
@@ -248,6 +250,67 @@ def basic_exp_dict():
     }
 
 
+def test_analysis_strings_are_expanded(mutable_mock_apps_repo):
+    """_analysis_strings, expands strings and lists of strings the same way"""
+
+    app_inst = mutable_mock_apps_repo.get('basic')
+    app_inst.expander = ramble.expander.Expander(basic_exp_dict(), None)
+
+    assert app_inst._analysis_strings(None) is None
+    assert app_inst._analysis_strings('Ranks {n_ranks}') == ['Ranks 4']
+    assert app_inst._analysis_strings(['Ranks {n_ranks}', 'Nodes {n_nodes}']) == \
+        ['Ranks 4', 'Nodes 2']
+    assert app_inst._analysis_strings(['Mod {mod_var}'], {'mod_var': '1'}) == ['Mod 1']
+    assert app_inst._analysis_strings(' Total {n_nodes}') == [' Total 2']
+
+
+class ContainsModifier(object):
+    """Minimal modifier defining a FOM with line filters"""
+    success_criteria = {}
+    figure_of_merit_contexts = {}
+    figures_of_merit = {
+        'mod_fom': {
+            'log_file': '{log_file}',
+            'regex': r'(?P<fom>[0-9]+)',
+            'parser': None,
+            'contains': [' Mod {mod_var}'],
+            'leading_token': 'Mod{mod_var}:',
+            'group_name': 'fom',
+            'units': '',
+            'contexts': []
+        }
+    }
+
+    def modded_variables(self, app):
+        return {'mod_var': '1'}
+
+    def __str__(self):
+        return 'contains-modifier'
+
+
+def test_analysis_dicts_expand_modifier_filters_once(mutable_mock_apps_repo, monkeypatch):
+    """_analysis_dicts, expands modifier FOM line filters once, with modifier variables"""
+
+    app_inst = mutable_mock_apps_repo.get('basic')
+    app_inst.expander = ramble.expander.Expander(basic_exp_dict(), None)
+    app_inst._modifier_instances = [ContainsModifier()]
+
+    expand_var = app_inst.expander.expand_var
+    expanded = []
+
+    def recording_expand_var(var, *args, **kwargs):
+        expanded.append(var)
+        return expand_var(var, *args, **kwargs)
+
+    monkeypatch.setattr(app_inst.expander, 'expand_var', recording_expand_var)
+
+    _, _, foms = app_inst._analysis_dicts(ramble.success_criteria.ScopedCriteriaList())
+
+    assert foms['mod_fom']['contains'] == [' Mod 1']
+    assert foms['mod_fom']['leading_tokens'] == ['Mod1:']
+    assert [var for var in expanded if 'Mod' in str(var)] == [' Mod {mod_var}', 'Mod{mod_var}:']
+
+
 def test_get_executable_graph_initial(mutable_mock_apps_repo):
     """_get_executable_graph, test1, workload executables"""
 
@@ -257,10 +320,10 @@ def test_get_executable_graph_initial(mutable_mock_apps_repo):
 
     # Set up the instance to test just the initial part of the function
     executable_application_instance.expander = ramble.expander.Expander(expansion_vars, None)
-    executable_application_instance.workloads = {'test_wl': {'executables': ['foo'],
-                                                             'inputs': ['input']},
-                                                 'test_wl2': {'executables': ['bar'],
-                                                              'inputs': ['input']}}
+    executable_application_instance.workloads = {
+        'test_wl': Workload(executables=('foo',), inputs=('input',)),
+        'test_wl2': Workload(executables=('bar',), inputs=('input',)),
+    }
     executable_application_instance.internals = {}
 
     executable_graph = executable_application_instance._get_executable_graph('test_wl2')
@@ -278,10 +341,10 @@ def test_get_executable_graph_yaml_defined(mutable_mock_apps_repo):
 
     # Set up the instance to pass the initial part of the function
     executable_application_instance.expander = ramble.expander.Expander(expansion_vars, None)
-    executable_application_instance.workloads = {'test_wl': {'executables': ['foo'],
-                                                             'inputs': ['input']},
-                                                 'test_wl2': {'executables': ['bar'],
-                                                              'inputs': ['input']}}
+    executable_application_instance.workloads = {
+        'test_wl': Workload(executables=('foo',), inputs=('input',)),
+        'test_wl2': Workload(executables=('bar',), inputs=('input',)),
+    }
 
     # Insert namespace.executables into the instance's internals to pass the
     # second part of the function
@@ -318,10 +381,10 @@ def test_get_executable_graph_custom_executables(mutable_mock_apps_repo):
 
     # Set up the instance to pass the initial part of the function
     executable_application_instance.expander = ramble.expander.Expander(expansion_vars, None)
-    executable_application_instance.workloads = {'test_wl': {'executables': ['foo'],
-                                                             'inputs': ['input']},
-                                                 'test_wl2': {'executables': ['bar'],
-                                                              'inputs': ['input']}}
+    executable_application_instance.workloads = {
+        'test_wl': Workload(executables=('foo',), inputs=('input',)),
+        'test_wl2': Workload(executables=('bar',), inputs=('input',)),
+    }
 
     # Insert namespace.executables into the instance's internals to pass the
     # second part of the function
@@ -407,10 +470,10 @@ def test_set_default_experiment_variables(mutable_mock_apps_repo):
     # Set up the instance to pass the initial part of the function
     executable_application_instance.expander = ramble.expander.Expander(expansion_vars, None)
 
-    executable_application_instance.workloads = {'test_wl': {'executables': ['foo'],
-                                                             'inputs': ['input']},
-                                                 'test_wl2': {'executables': ['bar'],
-                                                              'inputs': ['input']}}
+    executable_application_instance.workloads = {
+        'test_wl': Workload(executables=('foo',), inputs=('input',)),
+        'test_wl2': Workload(executables=('bar',), inputs=('input',)),
+    }
 
     executable_application_instance.internals = {}
 
@@ -435,10 +498,10 @@ def test_define_commands(mutable_mock_apps_repo):
     # Set up the instance to pass the initial part of the function
     executable_application_instance.expander = ramble.expander.Expander(expansion_vars, None)
 
-    executable_application_instance.workloads = {'test_wl': {'executables': ['foo'],
-                                                             'inputs': ['input']},
-                                                 'test_wl2': {'executables': ['bar'],
-                                                              'inputs': ['input']}}
+    executable_application_instance.workloads = {
+        'test_wl': Workload(executables=('foo',), inputs=('input',)),
+        'test_wl2': Workload(executables=('bar',), inputs=('input',)),
+    }
 
     executable_application_instance.internals = {}
 
@@ -509,13 +572,10 @@ ramble:
     # Set up the instance to pass the initial part of the function
     executable_application_instance.expander = ramble.expander.Expander(expansion_vars, None)
 
-    executable_application_instance.workloads = {'test_wl': {'executables': ['foo'],
-                                                             'inputs': ['input']},
-                                                 'test_wl2': {'executables': ['bar'],
-                                                              'inputs': ['input'],
-                                                              'template': ['input'],
-                                                              },
-                                                 }
+    executable_application_instance.workloads = {
+        'test_wl': Workload(executables=('foo',), inputs=('input',)),
+        'test_wl2': Workload(executables=('bar',), inputs=('input',)),
+    }
 
     executable_application_instance.internals = {}
 
@@ -0,0 +1,60 @@
+# Copyright 2022-2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+"""Perform tests of the FOM parsers used by builtin applications"""
+
+import re
+
+import pytest
+
+import ramble.repository
+
+
+def builtin_fom_parser(app_name, fom_name):
+    app_type = ramble.repository.ObjectTypes.applications
+    app_class = ramble.repository.paths[app_type].get_obj_class(app_name)
+    return app_class.figures_of_merit[fom_name]['parser']
+
+
+def streamc_kernel_regex(op_name):
+    # Regular expression previously used to extract STREAM kernel FOMs
+    opname = op_name.lower()
+    return re.compile(r'^' + op_name + r':' +
+                      r'\s+(?P<' + opname + r'_top_rate>[0-9]+\.[0-9]*)' +
+                      r'\s+(?P<' + opname + r'_avg_time>[0-9]+\.[0-9]*)' +
+                      r'\s+(?P<' + opname + r'_min_time>[0-9]+\.[0-9]*)' +
+                      r'\s+(?P<' + opname + r'_max_time>[0-9]+\.[0-9]*)')
+
+
+@pytest.mark.parametrize('op_name,line', [
+    ('Copy', 'Copy:           22381.9     0.057279     0.057193     0.057427\n'),
+    ('Scale', 'Scale:          15384.6     0.083512     0.083200     0.083831\n'),
+    ('Add', 'Add:            17143.2     0.112182     0.111997     0.112378\n'),
+    ('Triad', 'Triad:          17297.0     0.111264     0.111003     0.111567\n'),
+])
+def test_streamc_kernel_parser_matches_regex(op_name, line):
+    parser = builtin_fom_parser('streamc', f'{op_name} top rate')
+
+    assert parser(line) == streamc_kernel_regex(op_name).match(line).groupdict()
+
+
+@pytest.mark.parametrize('line', [
+    'Function    Best Rate MB/s  Avg time     Min time     Max time\n',
+    'Copy:           rate        avg          min          max\n',
+    'Copy:           22381.9     0.057279\n',
+    'Copy:\n',
+    'Copy: inf nan 1e3 -1\n',
+    'Copy: 1 2 3 4\n',
+    'Copy: .5 1.0 2.0 3.0\n',
+    '  Copy: 1.0 2.0 3.0 4.0\n',
+    '\n',
+])
+def test_streamc_kernel_parser_rejects_lines(line):
+    parser = builtin_fom_parser('streamc', 'Copy top rate')
+
+    assert parser(line) is None
+    assert streamc_kernel_regex('Copy').match(line) is None
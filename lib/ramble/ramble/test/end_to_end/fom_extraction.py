@@ -0,0 +1,117 @@
+# Copyright 2022-2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+import os
+
+import pytest
+
+import ramble.workspace
+import ramble.config
+import ramble.repository
+from ramble.main import RambleCommand
+
+
+# everything here uses the mock_workspace_path
+pytestmark = pytest.mark.usefixtures('mutable_config',
+                                     'mutable_mock_workspace_path',
+                                     'mock_applications',
+                                     )
+
+workspace = RambleCommand('workspace')
+
+
+def test_fom_extraction(
+        mutable_config,
+        mutable_mock_workspace_path,
+        mock_applications,
+        monkeypatch):
+    test_config = """
+ramble:
+  variables:
+    mpi_command: 'mpirun -n {n_ranks} -ppn {processes_per_node}'
+    batch_submit: 'batch_submit {execute_experiment}'
+    processes_per_node: '1'
+    n_threads: '1'
+  applications:
+    fom-extraction:
+      workloads:
+        test_wl:
+          experiments:
+            simple_test:
+              variables:
+                n_nodes: 1
+  spack:
+    concretized: true
+    packages: {}
+    environments: {}
+"""
+    log_lines = [
+        'Pair 3 4\n',
+        'Speed: 10.5 MB/s in 2.0 s\n',
+        'Widgets: 5 widgets\n',
+        'Gadgets: 7 widgets\n',
+        'Time: 1.5\n',
+        'Elapsed Time: 9.5\n',
+        '\n',
+    ]
+
+    app_type = ramble.repository.ObjectTypes.applications
+    app_cls = ramble.repository.paths[app_type].get_obj_class('fom-extraction')
+    parser = app_cls.figures_of_merit['pair_a']['parser']
+
+    # Wrap the parser shared by the pair group to record the lines it parses
+    parsed_lines = []
+
+    def counting_parser(line):
+        parsed_lines.append(line)
+        return parser(line)
+
+    for fom in ('pair_a', 'pair_b'):
+        monkeypatch.setitem(app_cls.figures_of_merit[fom], 'parser', counting_parser)
+
+    workspace_name = 'test_fom_extraction'
+    with ramble.workspace.create(workspace_name) as ws:
+        ws.write()
+
+        config_path = os.path.join(ws.config_dir, ramble.workspace.config_file_name)
+
+        with open(config_path, 'w+') as f:
+            f.write(test_config)
+        ws._re_read()
+
+        workspace('setup', '--dry-run', global_args=['-w', workspace_name])
+
+        exp_dir = os.path.join(ws.root, 'experiments', 'fom-extraction', 'test_wl',
+                               'simple_test')
+        with open(os.path.join(exp_dir, 'simple_test.out'), 'w+') as f:
+            f.writelines(log_lines)
+
+        workspace('analyze', global_args=['-w', workspace_name])
+
+        with open(os.path.join(ws.root, 'results.latest.txt'), 'r') as f:
+            data = f.read()
+
+        # Both FOMs of a group are extracted from one match
+        assert 'pair_a = 3' in data
+        assert 'pair_b = 4' in data
+        assert 'speed = 10.5 MB/s' in data
+        assert 'speed time = 2.0 s' in data
+
+        # Lines without the expanded contains string are skipped. The
+        # widgets line also has no FOM with its leading token, so is only
+        # tested against FOMs without one.
+        assert 'widgets = 5' in data
+        assert 'widgets = 7' not in data
+
+        # Only lines starting with the leading token are tested
+        assert 'time = 1.5 s' in data
+        assert 'time = 9.5 s' not in data
+
+        # The parser shared by a group is only called once per line, and FOMs
+        # without a leading token are tested on every line
+        assert parsed_lines == log_lines
@@ -0,0 +1,22 @@
+# Copyright 2022-2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+import ramble.util.graph
+
+
+def test_graph_node_dependencies_are_unique_and_ordered():
+    node = ramble.util.graph.GraphNode('phase')
+
+    for key in ['c', 'a', 'c', 'b', 'a']:
+        node.order_before(key)
+        node.order_after(key)
+
+    assert list(node._order_before) == ['c', 'a', 'b']
+    assert list(node._order_after) == ['c', 'a', 'b']
+    assert 'a' in node._order_before
+    assert 'd' not in node._order_after
@@ -62,7 +62,7 @@ class CommandExecutable(object):
     generally used to group one or more commands together into an executable
     name.
     """
-    def __init__(self, name, template, use_mpi=False, mpi=False, variables={},
+    def __init__(self, name, template, use_mpi=False, mpi=False, variables=None,
                  redirect='{log_file}', output_capture=OUTPUT_CAPTURE.DEFAULT, **kwargs):
         """Create a CommandExecutable instance
 
@@ -89,7 +89,7 @@ class CommandExecutable(object):
         self.mpi = use_mpi or mpi
         self.redirect = redirect
         self.output_capture = output_capture
-        self.variables = variables.copy()
+        self.variables = dict(variables) if variables else {}
 
     def copy(self):
         """Replicate a CommandExecutable instance"""
@@ -24,8 +24,10 @@ class GraphNode(object):
         """
         self.key = key
         self.attribute = attribute
-        self._order_before = []
-        self._order_after = []
+        # Dependencies are dictionary keys (with unused values), to keep
+        # insertion order while making duplicate checks constant time.
+        self._order_before = {}
+        self._order_after = {}
         self.obj_inst = obj_inst
 
     def set_attribute(self, attr):
@@ -39,20 +41,24 @@ class GraphNode(object):
     def order_before(self, key):
         """Adds information that this node should come before another node
 
+        Adding the same key more than once has no effect.
+
         Args:
             key (str): Key of node that should come after this node.
         """
 
-        self._order_before.append(key)
+        self._order_before[key] = None
 
     def order_after(self, key):
         """Adds information that this node should come after another node
 
+        Adding the same key more than once has no effect.
+
         Args:
             key (str): Key of node that should come before this node.
         """
 
-        self._order_after.append(key)
+        self._order_after[key] = None
 
     def __repr__(self):
         """Return a string representation of the node
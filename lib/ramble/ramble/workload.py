@@ -0,0 +1,79 @@
+# Copyright 2022-2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+"""Classes representing the workload definitions of an application"""
+
+
+class _SlottedDefinition(object):
+    """Base class for definitions stored in fixed attribute slots
+
+    Definitions use __slots__ instead of a per-instance dictionary, as
+    applications can define a large number of them.
+
+    Dictionary style access (`definition['attr']` and `'attr' in definition`)
+    is supported for compatibility with application definitions that index
+    into them. Attributes listed in _optional_slots are treated as not present
+    while they are set to None.
+    """
+    __slots__ = ()
+    _optional_slots = ()
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        if key in self._optional_slots:
+            return getattr(self, key) is not None
+        return key in self.__slots__
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
+
+    def __repr__(self):
+        attrs = ', '.join(f'{attr}={getattr(self, attr)!r}' for attr in self.__slots__)
+        return f'{type(self).__name__}({attrs})'
+
+
+class Workload(_SlottedDefinition):
+    """Class representing a single workload of an application"""
+    __slots__ = ('executables', 'inputs', 'tags')
+
+    def __init__(self, executables=(), inputs=(), tags=()):
+        """Constructor for a Workload
+
+        Args:
+            executables (tuple(str)): Names of executables in this workload
+            inputs (tuple(str)): Names of inputs used by this workload
+            tags (tuple(str)): Tags of this workload
+        """
+        self.executables = executables
+        self.inputs = inputs
+        self.tags = tags
+
+
+class WorkloadVariable(_SlottedDefinition):
+    """Class representing a variable definition of a workload"""
+    __slots__ = ('default', 'description', 'expandable', 'values')
+    _optional_slots = ('values', )
+
+    def __init__(self, default, description, expandable=True, values=None):
+        """Constructor for a WorkloadVariable
+
+        Args:
+            default: Default value of the variable
+            description (str): Description of the variable
+            expandable (bool): Whether the variable can be expanded
+            values (list): Suggested values for the variable
+        """
+        self.default = default
+        self.description = description
+        self.expandable = expandable
+        self.values = values
@@ -0,0 +1,47 @@
+# Copyright 2022-2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+from ramble.appkit import *
+
+
+def parse_pair_line(line):
+    tokens = line.split()
+    if len(tokens) != 3 or tokens[0] != 'Pair':
+        return None
+    return {'a': tokens[1], 'b': tokens[2]}
+
+
+class FomExtraction(ExecutableApplication):
+    name = "fom-extraction"
+
+    executable('foo', 'bar', use_mpi=False)
+
+    workload('test_wl', executable='foo')
+
+    workload_variable('widget_label', default='Widgets',
+                      description='Label of lines with widget counts',
+                      workload='test_wl')
+
+    figure_of_merit_group(foms=[('pair_a', 'a', ''),
+                                ('pair_b', 'b', '')],
+                          parser=parse_pair_line)
+
+    figure_of_merit_group(foms=[('speed', 'speed', 'MB/s'),
+                                ('speed time', 'time', 's')],
+                          fom_regex=r'Speed:\s+(?P<speed>[0-9]+\.[0-9]+) MB/s '
+                                    r'in (?P<time>[0-9]+\.[0-9]+) s')
+
+    figure_of_merit('widgets',
+                    fom_regex=r'.*?(?P<widgets>[0-9]+) widgets',
+                    contains=['{widget_label}:'],
+                    group_name='widgets', units='')
+
+    figure_of_merit('time',
+                    fom_regex=r'.*Time:\s+(?P<time>[0-9]+\.[0-9]+)',
+                    leading_token='Time:',
+                    group_name='time', units='s')
@@ -7,10 +7,48 @@
 # except according to those terms.
 
 import os
+import re
 from ramble.appkit import *
 from ramble.expander import Expander
 
 
+stream_kernels = {'Copy:', 'Scale:', 'Add:', 'Triad:'}
+
+
+def is_kernel_value(token):
+    r'''Check a token has the shape of a STREAM kernel value, [0-9]+\.[0-9]*'''
+    whole, dot, fraction = token.partition('.')
+    return bool(dot and whole and not whole.strip('0123456789')
+                and not fraction.strip('0123456789'))
+
+
+def parse_kernel_line(line):
+    r'''Parse a STREAM kernel line, e.g. "Copy: 22381.9 0.024 0.023 0.025"
+
+    Kernel lines have a fixed whitespace separated format, so they are split
+    directly instead of being matched against a regular expression. As with
+    the regular expression, the kernel name must start the line, and each
+    value must have the form [0-9]+\.[0-9]*.
+    '''
+    if not line or line[0].isspace():
+        return None
+
+    tokens = line.split()
+    if len(tokens) < 5 or tokens[0] not in stream_kernels:
+        return None
+
+    if not all(is_kernel_value(token) for token in tokens[1:5]):
+        return None
+
+    opname = tokens[0][:-1].lower()
+    return {
+        opname + '_top_rate': tokens[1],
+        opname + '_avg_time': tokens[2],
+        opname + '_min_time': tokens[3],
+        opname + '_max_time': tokens[4],
+    }
+
+
 class Streamc(SpackApplication):
     '''Define STREAMC application'''
     name = 'streamc'
@@ -40,31 +78,36 @@ class Streamc(SpackApplication):
 
     figure_of_merit("Array size",
                     log_file=log_file,
-                    fom_regex=r'Array size\s+\=\s+(?P<array_size>[0-9]+)',
+                    fom_regex=re.compile(r'Array size\s+\=\s+(?P<array_size>[0-9]+)'),
+                    contains='Array size',
                     group_name='array_size',
                     units='elements')
 
     figure_of_merit("Array memory",
                     log_file=log_file,
-                    fom_regex=r'Memory per array\s+\=\s+(?P<array_mem>[0-9]+)\.*[0-9]*',
+                    fom_regex=re.compile(r'Memory per array\s+\=\s+(?P<array_mem>[0-9]+)\.*[0-9]*'),
+                    contains='Memory per array',
                     group_name='array_mem',
                     units='MiB')
 
     figure_of_merit("Total memory",
                     log_file=log_file,
-                    fom_regex=r'Total memory required\s+\=\s+(?P<total_mem>[0-9]+\.*[0-9]*)',
+                    fom_regex=re.compile(r'Total memory required\s+\=\s+(?P<total_mem>[0-9]+\.*[0-9]*)'),
+                    contains='Total memory required',
                     group_name='total_mem',
                     units='MiB')
 
     figure_of_merit("Number of iterations per thread",
                     log_file=log_file,
-                    fom_regex=r'Each kernel will be executed\s+(?P<n_times>[0-9]+)',
+                    fom_regex=re.compile(r'Each kernel will be executed\s+(?P<n_times>[0-9]+)'),
+                    contains='Each kernel will be executed',
                     group_name='n_times',
                     units='')
 
     figure_of_merit("Number of threads",
                     log_file=log_file,
-                    fom_regex=r'Number of Threads counted\s+\=\s+(?P<n_threads>[0-9]+\.*[0-9]*)',
+                    fom_regex=re.compile(r'Number of Threads counted\s+\=\s+(?P<n_threads>[0-9]+\.*[0-9]*)'),
+                    contains='Number of Threads counted',
                     group_name='n_threads',
                     units='')
 
@@ -72,32 +115,10 @@ class Streamc(SpackApplication):
 
         opname = opName.lower()
 
-        opregex = (r'^' + opName + r':' +
-                   r'\s+(?P<' + opname + r'_top_rate>[0-9]+\.[0-9]*)' +
-                   r'\s+(?P<' + opname + r'_avg_time>[0-9]+\.[0-9]*)' +
-                   r'\s+(?P<' + opname + r'_min_time>[0-9]+\.[0-9]*)' +
-                   r'\s+(?P<' + opname + r'_max_time>[0-9]+\.[0-9]*)')
-
-        figure_of_merit(opName + ' top rate',
-                        log_file=log_file,
-                        fom_regex=opregex,
-                        group_name=(opname + '_top_rate'),
-                        units='MB/s')
-
-        figure_of_merit(opName + ' average time',
-                        log_file=log_file,
-                        fom_regex=opregex,
-                        group_name=(opname + '_avg_time'),
-                        units='s')
-
-        figure_of_merit(opName + ' min time',
-                        log_file=log_file,
-                        fom_regex=opregex,
-                        group_name=(opname + '_min_time'),
-                        units='s')
-
-        figure_of_merit(opName + ' max time',
-                        log_file=log_file,
-                        fom_regex=opregex,
-                        group_name=(opname + '_max_time'),
-                        units='s')
+        figure_of_merit_group(parser=parse_kernel_line,
+                              leading_token=opName + ':',
+                              log_file=log_file,
+                              foms=[(opName + ' top rate', opname + '_top_rate', 'MB/s'),
+                                    (opName + ' average time', opname + '_avg_time', 's'),
+                                    (opName + ' min time', opname + '_min_time', 's'),
+                                    (opName + ' max time', opname + '_max_time', 's')])